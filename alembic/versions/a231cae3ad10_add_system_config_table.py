@@ -31,11 +31,9 @@ def upgrade() -> None:
         sa.Column('updated_by', sa.String(length=50), nullable=True),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_system_config_id'), 'system_config', ['id'], unique=False)
     op.create_index(op.f('ix_system_config_key'), 'system_config', ['key'], unique=True)
 
 
 def downgrade() -> None:
     op.drop_index(op.f('ix_system_config_key'), table_name='system_config')
-    op.drop_index(op.f('ix_system_config_id'), table_name='system_config')
     op.drop_table('system_config')
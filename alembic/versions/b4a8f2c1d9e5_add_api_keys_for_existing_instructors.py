@@ -9,6 +9,7 @@ Excludes placeholder instructors (with usernames starting with "instructor_").
 """
 from typing import Sequence, Union
 from datetime import datetime
+import base64
 import secrets
 
 from alembic import op
@@ -22,10 +23,37 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def generate_api_key() -> str:
-    """Generate an API key in the format rmh_<random_base64_string>."""
-    random_part = secrets.token_urlsafe(32)
-    return f"rmh_{random_part}"
+# Lightweight table construct so values are bound through SQLAlchemy types
+api_keys_table = sa.table(
+    'api_keys',
+    sa.column('instructor_id', sa.Integer()),
+    sa.column('key', sa.String()),
+    sa.column('name', sa.String()),
+    sa.column('is_active', sa.Boolean()),
+    sa.column('created_at', sa.DateTime()),
+)
+
+
+KEY_BYTES = 32
+
+# 5 columns per row keeps each statement under SQLite's historical
+# 999 bound-parameter limit
+INSERT_BATCH_SIZE = 150
+
+
+def generate_api_keys(count: int) -> list[str]:
+    """
+    Generate API keys in the format rmh_<random_base64_string>.
+
+    Draws the randomness for all keys in a single call and slices it, which
+    yields the same format as secrets.token_urlsafe(32) per key (the format
+    the app issues).
+    """
+    raw = secrets.token_bytes(KEY_BYTES * count)
+    return [
+        "rmh_" + base64.urlsafe_b64encode(raw[i:i + KEY_BYTES]).rstrip(b"=").decode()
+        for i in range(0, len(raw), KEY_BYTES)
+    ]
 
 
 def upgrade() -> None:
@@ -39,6 +67,13 @@ def upgrade() -> None:
     """
     conn = op.get_bind()
 
+    # The anti-join below relies on this index (created in c6671aaf91d2);
+    # make sure it exists so the lookup doesn't scan api_keys per instructor
+    op.create_index(
+        op.f('ix_api_keys_instructor_id'), 'api_keys', ['instructor_id'],
+        unique=False, if_not_exists=True
+    )
+
     # Get all instructors that don't have API keys, excluding placeholders
     query = """
     SELECT i.id
@@ -54,26 +89,24 @@ def upgrade() -> None:
 
     if instructor_ids:
         # Generate and insert API keys
-        now = datetime.utcnow().isoformat()
-
-        for instructor_id in instructor_ids:
-            api_key = generate_api_key()
-
-            insert_query = """
-            INSERT INTO api_keys (instructor_id, key, name, is_active, created_at)
-            VALUES (:instructor_id, :key, :name, :is_active, :created_at)
-            """
-
-            conn.execute(
-                sa.text(insert_query),
-                {
-                    'instructor_id': instructor_id,
-                    'key': api_key,
-                    'name': 'Primary API Key',
-                    'is_active': True,
-                    'created_at': now
-                }
-            )
+        now = datetime.utcnow()
+        api_keys = generate_api_keys(len(instructor_ids))
+
+        rows = [
+            {
+                'instructor_id': instructor_id,
+                'key': api_key,
+                'name': 'Primary API Key',
+                'is_active': True,
+                'created_at': now
+            }
+            for instructor_id, api_key in zip(instructor_ids, api_keys)
+        ]
+
+        # Emit multi-row INSERT ... VALUES statements, chunked to stay under
+        # the bound-parameter limit of older SQLite builds
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            conn.execute(sa.insert(api_keys_table).values(rows[start:start + INSERT_BATCH_SIZE]))
 
         conn.commit()
         print(f"✓ Generated API keys for {len(instructor_ids)} instructor(s)")
@@ -91,13 +124,12 @@ def downgrade() -> None:
 
     # Delete API keys with the "Primary API Key" name (migration marker)
     # Only delete if they were created after this migration started
-    delete_query = """
-    DELETE FROM api_keys
-    WHERE name = 'Primary API Key'
-    AND created_at >= DATETIME('2025-01-05')
-    """
+    delete_stmt = sa.delete(api_keys_table).where(
+        api_keys_table.c.name == 'Primary API Key',
+        api_keys_table.c.created_at >= datetime(2025, 1, 5)
+    )
 
-    result = conn.execute(sa.text(delete_query))
+    result = conn.execute(delete_stmt)
     conn.commit()
 
     if result.rowcount:
@@ -1,28 +1,45 @@
 #!/usr/bin/env python3
 """Initialize database with demo data for testing."""
 import sys
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from models_v2 import Base, Instructor, Class, ClassMeeting, APIKey
+from functools import cache
+from models_v2 import Instructor, Class, ClassMeeting, APIKey
 from passlib.context import CryptContext
 from datetime import datetime
-from config import settings
+from database import SessionLocal, init_db
+
+
+@cache
+def get_pwd_context() -> CryptContext:
+    """Build the bcrypt context on first use; re-runs on seeded DBs never hash."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def init_demo_data():
     """Initialize database with demo instructor, class, and meeting."""
-    engine = create_engine(settings.database_url, connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {})
-    
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Create all tables (reuses the application engine and its tuning)
+    init_db()
+
     db = SessionLocal()
     
     try:
+        # Look up every demo entity that may already exist in one round-trip
+        row = (
+            db.query(Instructor, APIKey, Class, ClassMeeting)
+            .outerjoin(APIKey, APIKey.instructor_id == Instructor.id)
+            .outerjoin(Class, Class.instructor_id == Instructor.id)
+            .outerjoin(ClassMeeting, ClassMeeting.meeting_code == "DEMO2025")
+            .filter(Instructor.username == "demo")
+            .first()
+        )
+        if row:
+            existing, existing_key, existing_class, existing_meeting = row
+        else:
+            # No demo instructor means no key or class either; the meeting
+            # code is global, so it still needs its own check
+            existing = existing_key = existing_class = None
+            existing_meeting = db.query(ClassMeeting).filter(ClassMeeting.meeting_code == "DEMO2025").first()
+
         # Check if demo instructor already exists
-        existing = db.query(Instructor).filter(Instructor.username == "demo").first()
         if existing:
             print("✓ Demo instructor already exists")
             instructor = existing
@@ -32,17 +49,15 @@ def init_demo_data():
                 username="demo",
                 email="demo@example.com",
                 display_name="Demo Instructor",
-                password_hash=pwd_context.hash("demo123"),
+                password_hash=get_pwd_context().hash("demo123"),
                 created_at=datetime.utcnow(),
                 is_active=True
             )
             db.add(instructor)
-            db.commit()
-            db.refresh(instructor)
+            db.flush()
             print(f"✓ Created demo instructor (username: demo, password: demo123)")
         
         # Create API key
-        existing_key = db.query(APIKey).filter(APIKey.instructor_id == instructor.id).first()
         if existing_key:
             print(f"✓ API key already exists: {existing_key.key}")
             api_key = existing_key
@@ -55,12 +70,10 @@ def init_demo_data():
                 is_active=True
             )
             db.add(api_key)
-            db.commit()
-            db.refresh(api_key)
+            db.flush()
             print(f"✓ Created API key: {api_key.key}")
         
         # Create demo class
-        existing_class = db.query(Class).filter(Class.instructor_id == instructor.id).first()
         if existing_class:
             print(f"✓ Demo class already exists: {existing_class.name}")
             demo_class = existing_class
@@ -74,12 +87,10 @@ def init_demo_data():
                 is_archived=False
             )
             db.add(demo_class)
-            db.commit()
-            db.refresh(demo_class)
+            db.flush()
             print(f"✓ Created demo class: {demo_class.name}")
         
         # Create demo meeting
-        existing_meeting = db.query(ClassMeeting).filter(ClassMeeting.meeting_code == "DEMO2025").first()
         if existing_meeting:
             print(f"✓ Demo meeting already exists")
             meeting = existing_meeting
@@ -96,10 +107,13 @@ def init_demo_data():
                 is_active=True
             )
             db.add(meeting)
-            db.commit()
-            db.refresh(meeting)
+            db.flush()
             print(f"✓ Created demo meeting")
-        
+
+        # Commit everything in one transaction; flush() above assigned the
+        # primary keys needed for the foreign key references
+        db.commit()
+
         print("\n" + "="*70)
         print("🎉 Demo data initialized successfully!")
         print("="*70)
@@ -2,23 +2,45 @@
 Configuration management for RaiseMyHand using Pydantic Settings
 Loads settings from environment variables with sensible defaults
 """
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import secrets
 import os
 
 
+# Auto-generated once per process; used as defaults and to detect that the
+# secrets were never explicitly configured
+_DEFAULT_SECRET_KEY = secrets.token_urlsafe(32)
+_DEFAULT_CSRF_SECRET = secrets.token_urlsafe(32)
+
+
+def _select_env_file() -> str:
+    """Prefer .env (for local dev) over .env.demo (for Docker demo)"""
+    return ".env" if os.path.exists(".env") else ".env.demo"
+
+
+# Resolved once at import so repeated Settings() construction skips the stat
+_ENV_FILE = _select_env_file()
+
+
+# Docker secret for the admin password, read once into the environment so
+# Settings picks it up through the normal env loading
+_ADMIN_PASSWORD_SECRET = "/run/secrets/admin_password"
+if "ADMIN_PASSWORD" not in os.environ and os.path.exists(_ADMIN_PASSWORD_SECRET):
+    with open(_ADMIN_PASSWORD_SECRET, encoding="utf-8") as f:
+        os.environ["ADMIN_PASSWORD"] = f.read().strip()
+
+
 class Settings(BaseSettings):
     """Application configuration with environment variable support"""
 
-    # Prefer .env (for local dev) over .env.demo (for Docker demo)
-    _env_file = ".env" if os.path.exists(".env") else ".env.demo"
-
     model_config = SettingsConfigDict(
-        env_file=_env_file,
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
 
     # Environment
@@ -34,7 +56,7 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./data/raisemyhand.db"
 
     # Security Configuration - JWT
-    secret_key: str = secrets.token_urlsafe(32)
+    secret_key: str = _DEFAULT_SECRET_KEY
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 480  # 8 hours default
 
@@ -43,7 +65,7 @@ class Settings(BaseSettings):
     admin_password: Optional[str] = None
 
     # Security Configuration - CSRF
-    csrf_secret: str = secrets.token_urlsafe(32)
+    csrf_secret: str = _DEFAULT_CSRF_SECRET
     csrf_token_expiry: int = 3600  # 1 hour
 
     # Application Configuration
@@ -56,15 +78,21 @@ class Settings(BaseSettings):
     # Demo Mode
     demo_mode: bool = False
 
+    # Lower-cased env, computed once since settings are immutable
+    _env_normalized: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        self._env_normalized = self.env.lower()
+
     @property
     def is_production(self) -> bool:
         """Check if running in production"""
-        return self.env.lower() == "production"
+        return self._env_normalized == "production"
 
     @property
     def is_development(self) -> bool:
         """Check if running in development"""
-        return self.env.lower() == "development"
+        return self._env_normalized == "development"
 
     def validate_production_config(self) -> tuple[list[str], list[str]]:
         """Validate production configuration. Returns (errors, warnings)"""
@@ -73,10 +101,10 @@ class Settings(BaseSettings):
 
         if self.is_production:
             # Critical errors
-            if self.secret_key == secrets.token_urlsafe(32) or len(self.secret_key) < 32:
+            if self.secret_key == _DEFAULT_SECRET_KEY or len(self.secret_key) < 32:
                 errors.append("SECRET_KEY must be explicitly set and at least 32 characters in production")
 
-            if self.csrf_secret == secrets.token_urlsafe(32) or len(self.csrf_secret) < 32:
+            if self.csrf_secret == _DEFAULT_CSRF_SECRET or len(self.csrf_secret) < 32:
                 errors.append("CSRF_SECRET must be explicitly set and at least 32 characters in production")
 
             if not self.admin_password:
@@ -93,9 +121,6 @@ class Settings(BaseSettings):
 
         return errors, warnings
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
 
 # Global settings instance
 settings = Settings()
@@ -1,15 +1,37 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from models_v2 import Base  # V2 schema
 from config import settings
 
 DATABASE_URL = settings.database_url
+IS_SQLITE = "sqlite" in DATABASE_URL
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+engine_kwargs = {}
+if IS_SQLITE:
+    engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if DATABASE_URL.endswith(":memory:") or DATABASE_URL == "sqlite://":
+        # Share one connection so every session sees the same in-memory DB
+        engine_kwargs["poolclass"] = StaticPool
+elif DATABASE_URL.startswith(("postgresql://", "postgresql+psycopg2://")):
+    # Batch executemany() into multi-row INSERT ... VALUES statements
+    engine_kwargs["executemany_mode"] = "values_plus_batch"
+
+engine = create_engine(DATABASE_URL, **engine_kwargs)
+
+# Applied in a single executescript() call per new pooled connection
+SQLITE_PRAGMAS = (
+    "PRAGMA mmap_size=268435456;"  # 256 MB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA busy_timeout=30000;"
 )
 
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        """Tune each new SQLite connection for the read-heavy classroom workload."""
+        dbapi_conn.executescript(SQLITE_PRAGMAS)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -6,13 +6,21 @@ If no context specified, uses DEMO_CONTEXT environment variable or 'physics_101'
 """
 import sys
 import os
-import json
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker
 from passlib.context import CryptContext
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    import json
+    _json_loads = json.loads
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -23,6 +31,54 @@ from config import settings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+def _hash_password(password: str) -> str:
+    """Module-level so worker processes can unpickle it."""
+    return pwd_context.hash(password)
+
+
+def hash_passwords(passwords: list) -> list:
+    """Hash passwords with bcrypt, spread across CPU cores when there are several."""
+    workers = min(len(passwords), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_hash_password(password) for password in passwords]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_hash_password, passwords))
+
+
+# Bulk-load tuning for SQLite: WAL with relaxed syncing instead of an fsync
+# per commit, and a 64 MB page cache for the question/vote inserts
+LOADER_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-65536;"
+)
+
+
+def _set_loader_pragmas(dbapi_conn, connection_record):
+    """Apply LOADER_SQLITE_PRAGMAS to each new loader connection."""
+    dbapi_conn.executescript(LOADER_SQLITE_PRAGMAS)
+
+
+def _dialect_insert(db, model):
+    """Dialect-specific insert(model) that supports ON CONFLICT clauses."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        raise ValueError(f"Unsupported database for demo loading: {dialect}")
+    return dialect_insert(model)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp; fixtures repeat the same values many times."""
+    return datetime.fromisoformat(value)
+
+
 class DemoContextLoader:
     """Load demo context from JSON files."""
     
@@ -38,15 +94,36 @@ class DemoContextLoader:
         self.class_map = {}
         self.meeting_map = {}
         self.api_key_map = {}
+        
+        # Parsed JSON files by name; instructors.json feeds two phases
+        self._json_cache = {}
+        
+        # Single timestamp for records without their own, and for audit fields
+        self.now = datetime.utcnow()
+    
+    def parse_timestamp(self, record: dict, field: str) -> datetime:
+        """Parse record[field], defaulting to the load time when absent."""
+        value = record.get(field)
+        return _parse_timestamp(value) if value else self.now
     
     def load_json(self, filename: str) -> dict:
-        """Load JSON file from context directory."""
+        """Load JSON file from context directory, parsing each file once."""
+        if filename in self._json_cache:
+            return self._json_cache[filename]
+        
+        filepath = self.context_dir / filename
+        data = _json_loads(filepath.read_bytes()) if filepath.exists() else {}
+        self._json_cache[filename] = data
+        return data
+    
+    def load_ndjson(self, filename: str) -> list:
+        """Load newline-delimited JSON records from context directory."""
         filepath = self.context_dir / filename
         if not filepath.exists():
-            return {}
+            return []
         
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return [_json_loads(line) for line in f if line.strip()]
     
     def load_instructors(self, db):
         """Load instructors from instructors.json."""
@@ -56,12 +133,23 @@ class DemoContextLoader:
         
         print(f"\n📚 Loading {len(data['instructors'])} instructors...")
         
+        # One query for all existing instructors instead of one per record
+        existing_by_username = {
+            instructor.username: instructor
+            for instructor in db.query(Instructor).filter(
+                Instructor.username.in_([inst["username"] for inst in data["instructors"]])
+            )
+        }
+        
+        # bcrypt dominates this step, so hash all new passwords up front
+        password_hashes = iter(hash_passwords([
+            inst.get("password", "demo123")
+            for inst in data["instructors"]
+            if inst["username"] not in existing_by_username
+        ]))
+        
         for inst_data in data["instructors"]:
-            # Check if instructor already exists
-            existing = db.query(Instructor).filter(
-                Instructor.username == inst_data["username"]
-            ).first()
-            
+            existing = existing_by_username.get(inst_data["username"])
             if existing:
                 print(f"  ⚠ Instructor '{inst_data['username']}' already exists, skipping")
                 self.instructor_map[inst_data["username"]] = existing
@@ -71,18 +159,18 @@ class DemoContextLoader:
                 username=inst_data["username"],
                 email=inst_data.get("email"),
                 display_name=inst_data.get("display_name"),
-                password_hash=pwd_context.hash(inst_data.get("password", "demo123")),
-                created_at=datetime.fromisoformat(inst_data.get("created_at", datetime.utcnow().isoformat())),
+                password_hash=next(password_hashes),
+                created_at=self.parse_timestamp(inst_data, "created_at"),
                 is_active=inst_data.get("is_active", True),
                 role=inst_data.get("role", "INSTRUCTOR")
             )
             db.add(instructor)
-            db.flush()  # Get ID without committing
             
             self.instructor_map[inst_data["username"]] = instructor
             print(f"  ✓ Created instructor: {instructor.display_name} (@{instructor.username})")
         
-        db.commit()
+        # One batched INSERT for the whole phase; later phases need the ids
+        db.flush()
     
     def load_api_keys(self, db):
         """Load API keys from instructors.json."""
@@ -92,16 +180,24 @@ class DemoContextLoader:
         
         print(f"\n🔑 Loading API keys...")
         
+        # First existing key per instructor, fetched in one query
+        existing_by_instructor = {}
+        for key in db.query(APIKey).filter(
+            APIKey.instructor_id.in_([inst.id for inst in self.instructor_map.values()])
+        ):
+            existing_by_instructor.setdefault(key.instructor_id, key)
+        
+        # Keys for records that don't ship one, drawn in a single batch
+        generated_keys = iter(APIKey.generate_keys(
+            sum(1 for inst in data["instructors"] if not inst.get("api_key"))
+        ))
+        
         for inst_data in data["instructors"]:
             instructor = self.instructor_map.get(inst_data["username"])
             if not instructor:
                 continue
             
-            # Check if this instructor already has API keys
-            existing_key = db.query(APIKey).filter(
-                APIKey.instructor_id == instructor.id
-            ).first()
-            
+            existing_key = existing_by_instructor.get(instructor.id)
             if existing_key:
                 print(f"  ⚠ API key for '{inst_data['username']}' already exists")
                 self.api_key_map[inst_data["username"]] = existing_key
@@ -110,18 +206,17 @@ class DemoContextLoader:
             # Create API key
             api_key = APIKey(
                 instructor_id=instructor.id,
-                key=inst_data.get("api_key", APIKey.generate_key()),
+                key=inst_data.get("api_key") or next(generated_keys),
                 name=inst_data.get("api_key_name", f"{instructor.display_name}'s API Key"),
-                created_at=datetime.utcnow(),
+                created_at=self.now,
                 is_active=True
             )
             db.add(api_key)
-            db.flush()
             
             self.api_key_map[inst_data["username"]] = api_key
             print(f"  ✓ Created API key for {instructor.display_name}: {api_key.key}")
         
-        db.commit()
+        db.flush()
     
     def load_classes(self, db):
         """Load classes from classes.json."""
@@ -131,18 +226,21 @@ class DemoContextLoader:
         
         print(f"\n📖 Loading {len(data['classes'])} classes...")
         
+        # One query for all existing classes of the loaded instructors
+        existing_by_key = {
+            (class_obj.instructor_id, class_obj.name): class_obj
+            for class_obj in db.query(Class).filter(
+                Class.instructor_id.in_([inst.id for inst in self.instructor_map.values()])
+            )
+        }
+        
         for class_data in data["classes"]:
             instructor = self.instructor_map.get(class_data["instructor_username"])
             if not instructor:
                 print(f"  ⚠ Instructor '{class_data['instructor_username']}' not found, skipping class")
                 continue
             
-            # Check if class already exists
-            existing = db.query(Class).filter(
-                Class.instructor_id == instructor.id,
-                Class.name == class_data["name"]
-            ).first()
-            
+            existing = existing_by_key.get((instructor.id, class_data["name"]))
             if existing:
                 print(f"  ⚠ Class '{class_data['name']}' already exists, skipping")
                 self.class_map[class_data["class_id"]] = existing
@@ -152,17 +250,16 @@ class DemoContextLoader:
                 instructor_id=instructor.id,
                 name=class_data["name"],
                 description=class_data.get("description", ""),
-                created_at=datetime.fromisoformat(class_data.get("created_at", datetime.utcnow().isoformat())),
-                updated_at=datetime.utcnow(),
+                created_at=self.parse_timestamp(class_data, "created_at"),
+                updated_at=self.now,
                 is_archived=class_data.get("is_archived", False)
             )
             db.add(class_obj)
-            db.flush()
             
             self.class_map[class_data["class_id"]] = class_obj
             print(f"  ✓ Created class: {class_obj.name}")
         
-        db.commit()
+        db.flush()
     
     def load_meetings(self, db):
         """Load meetings from meetings.json."""
@@ -172,6 +269,24 @@ class DemoContextLoader:
         
         print(f"\n🎓 Loading {len(data['meetings'])} class meetings...")
         
+        # One query for all meetings whose codes are already taken
+        existing_by_code = {
+            meeting.meeting_code: meeting
+            for meeting in db.query(ClassMeeting).filter(
+                ClassMeeting.meeting_code.in_([m["meeting_code"] for m in data["meetings"]])
+            )
+        }
+        
+        # Hash the passwords of new protected meetings in one batch
+        protected = [
+            m for m in data["meetings"]
+            if m.get("password") and m["meeting_code"] not in existing_by_code
+        ]
+        password_hashes = dict(zip(
+            (m["meeting_code"] for m in protected),
+            hash_passwords([m["password"] for m in protected])
+        ))
+        
         for meeting_data in data["meetings"]:
             class_obj = self.class_map.get(meeting_data["class_id"])
             if not class_obj:
@@ -182,11 +297,7 @@ class DemoContextLoader:
             instructor_username = meeting_data.get("instructor_username")
             api_key = self.api_key_map.get(instructor_username)
             
-            # Check if meeting already exists
-            existing = db.query(ClassMeeting).filter(
-                ClassMeeting.meeting_code == meeting_data["meeting_code"]
-            ).first()
-            
+            existing = existing_by_code.get(meeting_data["meeting_code"])
             if existing:
                 print(f"  ⚠ Meeting '{meeting_data['title']}' already exists, skipping")
                 self.meeting_map[meeting_data["meeting_id"]] = existing
@@ -198,78 +309,84 @@ class DemoContextLoader:
                 meeting_code=meeting_data["meeting_code"],
                 instructor_code=meeting_data["instructor_code"],
                 title=meeting_data["title"],
-                password_hash=pwd_context.hash(meeting_data["password"]) if meeting_data.get("password") else None,
-                created_at=datetime.fromisoformat(meeting_data.get("created_at", datetime.utcnow().isoformat())),
-                started_at=datetime.fromisoformat(meeting_data.get("started_at", datetime.utcnow().isoformat())),
+                password_hash=password_hashes.get(meeting_data["meeting_code"]),
+                created_at=self.parse_timestamp(meeting_data, "created_at"),
+                started_at=self.parse_timestamp(meeting_data, "started_at"),
                 is_active=meeting_data.get("is_active", True)
             )
             db.add(meeting)
-            db.flush()
             
             self.meeting_map[meeting_data["meeting_id"]] = meeting
             print(f"  ✓ Created meeting: {meeting.title} (code: {meeting.meeting_code})")
         
-        db.commit()
+        db.flush()
     
     def load_questions(self, db):
-        """Load questions from questions.json."""
-        data = self.load_json("questions.json")
-        if not data or "questions" not in data:
-            return
+        """Load questions from questions.ndjson or questions.json."""
+        questions = self.load_ndjson("questions.ndjson")
+        if not questions:
+            data = self.load_json("questions.json")
+            if not data or "questions" not in data:
+                return
+            questions = data["questions"]
         
-        print(f"\n❓ Loading {len(data['questions'])} questions...")
+        print(f"\n❓ Loading {len(questions)} questions...")
         
-        question_map = {}
-        for q_data in data["questions"]:
-            meeting = self.meeting_map.get(q_data["meeting_id"])
+        # Collect rows first, then insert questions and votes in two batches
+        question_rows = []
+        votes_by_number = {}
+        # Bound once for the per-question and per-vote loops below
+        meeting_map = self.meeting_map
+        parse_timestamp = self.parse_timestamp
+        for q_data in questions:
+            meeting = meeting_map.get(q_data["meeting_id"])
             if not meeting:
                 print(f"  ⚠ Meeting ID '{q_data['meeting_id']}' not found, skipping question")
                 continue
             
-            # Check if question already exists
-            existing = db.query(Question).filter(
-                Question.meeting_id == meeting.id,
-                Question.question_number == q_data["question_number"]
-            ).first()
-            
-            if existing:
-                question_map[q_data.get("question_id", f"{q_data['meeting_id']}_q{q_data['question_number']}")] = existing
-                continue
-            
-            question = Question(
-                meeting_id=meeting.id,
-                student_id=q_data.get("student_id", f"student_{q_data['question_number']:03d}"),
-                question_number=q_data["question_number"],
-                text=q_data["text"],
-                sanitized_text=q_data["text"],  # Same as text for demo (no profanity)
-                status="approved",  # Demo questions are pre-approved
-                upvotes=0,  # Will be calculated from votes
-                created_at=datetime.fromisoformat(q_data.get("created_at", datetime.utcnow().isoformat())),
-                is_answered_in_class=q_data.get("is_answered_in_class", False)
+            number = q_data["question_number"]
+            text = q_data["text"]
+            votes = q_data.get("votes", ())
+            question_rows.append({
+                "meeting_id": meeting.id,
+                # Default only formatted for records that lack a student id
+                "student_id": q_data["student_id"] if "student_id" in q_data else f"student_{number:03d}",
+                "question_number": number,
+                "text": text,
+                "sanitized_text": text,  # Same as text for demo (no profanity)
+                "status": "approved",  # Demo questions are pre-approved
+                "upvotes": len(votes),  # One upvote per recorded vote
+                "created_at": parse_timestamp(q_data, "created_at"),
+                "is_answered_in_class": q_data.get("is_answered_in_class", False)
+            })
+            votes_by_number[(meeting.id, number)] = votes
+        
+        inserted = vote_rows = ()
+        if question_rows:
+            # Questions already loaded are skipped by the unique constraint
+            # instead of a pre-check; RETURNING lists only the inserted ones
+            stmt = _dialect_insert(db, Question).on_conflict_do_nothing(
+                index_elements=[Question.meeting_id, Question.question_number]
             )
-            db.add(question)
-            db.flush()
-            
-            question_map[q_data.get("question_id", f"{q_data['meeting_id']}_q{q_data['question_number']}")] = question
-            
-            # Add votes if specified
-            if "votes" in q_data:
-                for vote_data in q_data["votes"]:
-                    vote = QuestionVote(
-                        question_id=question.id,
-                        student_id=vote_data["student_id"],
-                        created_at=datetime.fromisoformat(vote_data.get("created_at", datetime.utcnow().isoformat()))
-                    )
-                    db.add(vote)
-                
-                # Update upvotes count
-                question.upvotes = len(q_data["votes"])
+            inserted = db.execute(
+                stmt.returning(Question.id, Question.meeting_id, Question.question_number),
+                question_rows
+            ).all()
             
-            if q_data["question_number"] % 5 == 0:
-                print(f"  ✓ Loaded {q_data['question_number']} questions...")
+            vote_rows = [
+                {
+                    "question_id": question_id,
+                    "student_id": vote_data["student_id"],
+                    "created_at": parse_timestamp(vote_data, "created_at")
+                }
+                for question_id, meeting_id, question_number in inserted
+                for vote_data in votes_by_number[(meeting_id, question_number)]
+            ]
+            if vote_rows:
+                db.execute(insert(QuestionVote), vote_rows)
         
-        print(f"  ✓ Loaded all {len(data['questions'])} questions")
-        db.commit()
+        # One summary line rather than per-row progress output
+        print(f"  ✓ Loaded {len(inserted)} new questions with {len(vote_rows)} votes")
     
     def load_system_config(self, db):
         """Load system configuration overrides from config.json."""
@@ -279,28 +396,60 @@ class DemoContextLoader:
         
         print(f"\n⚙️  Loading system configuration...")
         
+        # Like set_value, an existing description is only replaced when the
+        # config entry provides one, so rows are split on that
+        rows_by_has_description = {True: [], False: []}
         for config_data in data["config"]:
-            SystemConfig.set_value(
-                db,
-                key=config_data["key"],
-                value=config_data["value"],
-                value_type=config_data.get("value_type", "string"),
-                description=config_data.get("description", ""),
-                updated_by="demo_loader"
-            )
+            value_type = config_data.get("value_type", "string")
+            description = config_data.get("description")
+            rows_by_has_description[bool(description)].append({
+                "key": config_data["key"],
+                "value": SystemConfig.serialize_value(config_data["value"], value_type),
+                "value_type": value_type,
+                "description": description or f"System setting: {config_data['key']}",
+                "updated_by": "demo_loader",
+                "created_at": self.now,
+                "updated_at": self.now
+            })
             print(f"  ✓ Set config: {config_data['key']} = {config_data['value']}")
+        
+        # Upsert each group in one statement instead of a SELECT per key
+        for has_description, rows in rows_by_has_description.items():
+            if not rows:
+                continue
+            columns = ["value", "value_type", "updated_by", "updated_at"]
+            if has_description:
+                columns.append("description")
+            stmt = _dialect_insert(db, SystemConfig)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SystemConfig.key],
+                set_={column: stmt.excluded[column] for column in columns}
+            )
+            db.execute(stmt, rows)
     
     def load_all(self):
         """Load entire demo context."""
-        engine = create_engine(
-            settings.database_url,
-            connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-        )
+        database_url = settings.database_url
+        is_sqlite = "sqlite" in database_url
+        engine_kwargs = {}
+        if is_sqlite:
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+        elif database_url.startswith(("postgresql://", "postgresql+psycopg2://")):
+            # Same psycopg2 batching as the app engine, with larger pages
+            # for the question/vote bulk inserts
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+            engine_kwargs["insertmanyvalues_page_size"] = 10_000
+        engine = create_engine(database_url, **engine_kwargs)
+        if is_sqlite:
+            event.listen(engine, "connect", _set_loader_pragmas)
         
         # Create tables if they don't exist
         Base.metadata.create_all(bind=engine)
         
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        # Keep loaded objects usable after the commit: the summary below reads
+        # every instructor, key and meeting, which would otherwise refresh
+        # each one with its own SELECT
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
         db = SessionLocal()
         
         try:
@@ -315,6 +464,9 @@ class DemoContextLoader:
             self.load_questions(db)
             self.load_system_config(db)
             
+            # Everything above runs in one transaction; commit it once
+            db.commit()
+            
             print("\n" + "="*70)
             print("✅ Demo context loaded successfully!")
             print("="*70)
@@ -2,14 +2,64 @@
 Centralized logging configuration for RaiseMyHand
 Provides structured logging with different handlers for development and production
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
 from config import settings
 
 
+class SizeTrackingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size in memory.
+
+    The stock handler seeks to the end of the file on every record to
+    decide whether to roll over; this keeps a running byte count instead,
+    seeded from the file size whenever the file is (re)opened.
+    """
+
+    _bytes_written = 0
+    _pending_bytes = 0
+
+    def _open(self):
+        stream = super()._open()
+        self._bytes_written = stream.seek(0, os.SEEK_END)
+        return stream
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        # Count encoded bytes, the same unit as the file offset seeded in _open
+        msg = self.format(record) + self.terminator
+        self._pending_bytes = len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+        return self._bytes_written + self._pending_bytes >= self.maxBytes
+
+    def emit(self, record):
+        super().emit(record)
+        self._bytes_written += self._pending_bytes
+
+
+# Rotating log file written in production
+LOG_DIR = Path("logs")
+LOG_FILE = LOG_DIR / "app.log"
+
+# Background thread that writes queued records to the real handlers
+_queue_listener = None
+
+
+def stop_logging():
+    """Flush queued log records and stop the background log writer."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def setup_logging():
     """
     Configure centralized logging system.
@@ -24,10 +74,14 @@ def setup_logging():
       - File rotation (logs/app.log)
       - WARNING level by default
       - Detailed format with timestamps
+
+    Handlers run on a background QueueListener thread; loggers only enqueue
+    records, so request handlers never block on console or file I/O.
     """
+    global _queue_listener
+
     # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    LOG_DIR.mkdir(exist_ok=True)
 
     # Determine log level
     if settings.is_development:
@@ -58,26 +112,33 @@ def setup_logging():
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Remove existing handlers (and the writer thread of a previous setup)
+    stop_logging()
     root_logger.handlers.clear()
 
     # Console Handler (always enabled)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File Handler with rotation (production only)
     if settings.is_production:
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename=log_dir / "app.log",
+        file_handler = SizeTrackingRotatingFileHandler(
+            filename=LOG_FILE,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
             encoding='utf-8'
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Root logger only enqueues; the listener formats and writes
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Suppress noisy third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -89,11 +150,37 @@ def setup_logging():
     logger.info(f"Logging initialized - Environment: {settings.env}, Level: {logging.getLevelName(log_level)}")
 
     if settings.is_production:
-        logger.info(f"Log files: {log_dir.absolute()}/app.log")
+        logger.info(f"Log files: {LOG_FILE.absolute()}")
 
     return logger
 
 
+# Flush anything still queued when the interpreter exits
+atexit.register(stop_logging)
+
+
+def read_recent_logs(max_bytes: int = 1_000_000) -> str:
+    """
+    Return the tail of the current log file, at most max_bytes long.
+
+    Seeks from the end so the cost does not grow with the file size; a
+    partial first line left by the cut is dropped.
+    """
+    try:
+        with LOG_FILE.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - max_bytes)
+            f.seek(start)
+            data = f.read()
+    except FileNotFoundError:
+        return ""
+
+    if start > 0:
+        newline = data.find(b"\n")
+        data = data[newline + 1:] if newline != -1 else b""
+    return data.decode("utf-8", errors="replace")
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -138,6 +225,15 @@ class LogLevelContext:
         self.logger.setLevel(self.original_level)
 
 
+# Message templates for the structured helpers below. They are passed to the
+# logger unformatted, so the fixed text is only rendered for emitted records.
+_REQUEST_FMT = "%s %s - %d - %.2fms%s"
+_DB_FMT = "DB %s: %s%s"
+_DB_FAILED_FMT = "DB %s FAILED: %s%s%s"
+_WS_FMT = "WS %s [session=%s]%s"
+_SECURITY_FMT = "SECURITY %s: %s"
+
+
 # Utility function for structured logging
 def log_request(logger: logging.Logger, method: str, endpoint: str, status_code: int, duration_ms: float, user_id: str = None):
     """
@@ -151,14 +247,19 @@ def log_request(logger: logging.Logger, method: str, endpoint: str, status_code:
         duration_ms: Request duration in milliseconds
         user_id: Optional user identifier
     """
-    extra_info = f" [user={user_id}]" if user_id else ""
-
     if status_code >= 500:
-        logger.error(f"{method} {endpoint} - {status_code} - {duration_ms:.2f}ms{extra_info}")
+        level = logging.ERROR
     elif status_code >= 400:
-        logger.warning(f"{method} {endpoint} - {status_code} - {duration_ms:.2f}ms{extra_info}")
+        level = logging.WARNING
     else:
-        logger.info(f"{method} {endpoint} - {status_code} - {duration_ms:.2f}ms{extra_info}")
+        level = logging.INFO
+
+    # Skip all formatting when the record would be discarded anyway
+    if not logger.isEnabledFor(level):
+        return
+
+    extra_info = f" [user={user_id}]" if user_id else ""
+    logger.log(level, _REQUEST_FMT, method, endpoint, status_code, duration_ms, extra_info)
 
 
 def log_database_operation(logger: logging.Logger, operation: str, table: str, record_id: int = None, success: bool = True, error: Exception = None):
@@ -173,13 +274,17 @@ def log_database_operation(logger: logging.Logger, operation: str, table: str, r
         success: Whether operation succeeded
         error: Optional exception if operation failed
     """
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+
     record_info = f" [id={record_id}]" if record_id else ""
 
     if success:
-        logger.info(f"DB {operation}: {table}{record_info}")
+        logger.info(_DB_FMT, operation, table, record_info)
     else:
         error_msg = f": {str(error)}" if error else ""
-        logger.error(f"DB {operation} FAILED: {table}{record_info}{error_msg}")
+        logger.error(_DB_FAILED_FMT, operation, table, record_info, error_msg)
 
 
 def log_websocket_event(logger: logging.Logger, event: str, session_code: str, details: str = None):
@@ -192,8 +297,11 @@ def log_websocket_event(logger: logging.Logger, event: str, session_code: str, d
         session_code: Session code
         details: Optional additional details
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     details_info = f": {details}" if details else ""
-    logger.info(f"WS {event} [session={session_code}]{details_info}")
+    logger.info(_WS_FMT, event, session_code, details_info)
 
 
 def log_security_event(logger: logging.Logger, event: str, details: str, severity: str = "warning"):
@@ -206,5 +314,9 @@ def log_security_event(logger: logging.Logger, event: str, details: str, severit
         details: Event details
         severity: Log level (info, warning, error, critical)
     """
-    log_func = getattr(logger, severity.lower(), logger.warning)
-    log_func(f"SECURITY {event}: {details}")
+    level = logging.getLevelName(severity.upper())
+    if not isinstance(level, int):
+        level = logging.WARNING
+
+    if logger.isEnabledFor(level):
+        logger.log(level, _SECURITY_FMT, event, details)
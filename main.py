@@ -1,12 +1,14 @@
 from fastapi import FastAPI, Depends, HTTPException, WebSocket, WebSocketDisconnect, Request, Header
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session as DBSession, joinedload, selectinload
 from sqlalchemy import func
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from typing import List, Optional
+import asyncio
 import json
 import qrcode
 from io import BytesIO
@@ -14,7 +16,6 @@ import csv
 from io import StringIO
 import os
 from dotenv import load_dotenv
-import pytz
 import secrets
 import hmac
 import hashlib
@@ -47,7 +48,10 @@ from models_v2 import (
     Instructor,
     Class,
     Answer,
-    QuestionVote
+    QuestionVote,
+    MEETING_BY_CODE,
+    ACTIVE_MEETING_BY_CODE,
+    MEETING_BY_INSTRUCTOR_CODE
 )
 # V2 Schemas
 from schemas_v2 import (
@@ -74,7 +78,7 @@ from routes_answers import router as answers_router
 from routes_admin import router as admin_router
 from routes_admin_users import router as admin_users_router
 from routes_config import router as config_router, set_manager
-from logging_config import setup_logging, get_logger, log_request, log_database_operation, log_websocket_event, log_security_event
+from logging_config import setup_logging, read_recent_logs, get_logger, log_request, log_database_operation, log_websocket_event, log_security_event
 
 # Configure centralized logging
 setup_logging()
@@ -128,10 +132,10 @@ if settings.is_production:
 
 # Initialize timezone
 try:
-    LOCAL_TZ = pytz.timezone(settings.timezone)
-except pytz.exceptions.UnknownTimeZoneError:
+    LOCAL_TZ = ZoneInfo(settings.timezone)
+except (ZoneInfoNotFoundError, ValueError):
     logger.warning(f"Unknown timezone '{settings.timezone}', falling back to UTC")
-    LOCAL_TZ = pytz.UTC
+    LOCAL_TZ = timezone.utc
 
 
 # API Key verification (specific to this app, not in security.py)
@@ -234,9 +238,9 @@ def to_local_time(utc_dt: datetime) -> str:
     """Convert UTC datetime to local timezone and return ISO format string."""
     if utc_dt is None:
         return None
-    # Ensure the datetime is timezone-aware (UTC)
+    # Stored timestamps are naive UTC; mark them aware before converting
     if utc_dt.tzinfo is None:
-        utc_dt = pytz.UTC.localize(utc_dt)
+        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
     # Convert to local timezone
     local_dt = utc_dt.astimezone(LOCAL_TZ)
     return local_dt.isoformat()
@@ -333,10 +337,18 @@ def startup_event():
         db.close()
 
 
+def encode_ws_message(message: dict) -> str:
+    """Serialize a WebSocket message once so it can be sent to every client.
+
+    Uses the same settings as Starlette's send_json.
+    """
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: dict[str, list[WebSocket]] = {}
+        self.active_connections: dict[str, set[WebSocket]] = {}
         # Rate limiting: track message counts per connection
         self.message_counts: dict[WebSocket, list[float]] = {}
         # Connection timestamps for timeout tracking
@@ -345,17 +357,16 @@ class ConnectionManager:
     async def connect(self, websocket: WebSocket, session_code: str):
         await websocket.accept()
         if session_code not in self.active_connections:
-            self.active_connections[session_code] = []
-        self.active_connections[session_code].append(websocket)
+            self.active_connections[session_code] = set()
+        self.active_connections[session_code].add(websocket)
         # Initialize rate limiting and timeout tracking
         self.message_counts[websocket] = []
-        self.connection_times[websocket] = datetime.utcnow().timestamp()
+        self.connection_times[websocket] = datetime.now(timezone.utc).timestamp()
         log_websocket_event(logger, "CONNECT", session_code, f"Active connections: {len(self.active_connections[session_code])}")
 
     def disconnect(self, websocket: WebSocket, session_code: str):
         if session_code in self.active_connections:
-            if websocket in self.active_connections[session_code]:
-                self.active_connections[session_code].remove(websocket)
+            self.active_connections[session_code].discard(websocket)
             remaining = len(self.active_connections[session_code])
             if not self.active_connections[session_code]:
                 del self.active_connections[session_code]
@@ -371,7 +382,7 @@ class ConnectionManager:
         Check if a WebSocket connection is within rate limits.
         Returns True if within limits, False if rate limit exceeded.
         """
-        current_time = datetime.utcnow().timestamp()
+        current_time = datetime.now(timezone.utc).timestamp()
 
         # Clean old timestamps outside the window
         if websocket in self.message_counts:
@@ -395,43 +406,54 @@ class ConnectionManager:
         Returns True if connection should be closed, False if still valid.
         """
         if websocket in self.connection_times:
-            current_time = datetime.utcnow().timestamp()
+            current_time = datetime.now(timezone.utc).timestamp()
             elapsed = current_time - self.connection_times[websocket]
             return elapsed > timeout_seconds
         return False
 
     def update_activity(self, websocket: WebSocket):
         """Update the last activity timestamp for a connection."""
-        self.connection_times[websocket] = datetime.utcnow().timestamp()
+        self.connection_times[websocket] = datetime.now(timezone.utc).timestamp()
+
+    async def _send_to(self, targets: list[tuple[WebSocket, str]], payload: str) -> list[tuple[WebSocket, str]]:
+        """
+        Send a payload to (connection, session_code) pairs concurrently.
+        Returns the pairs whose send failed so the caller can disconnect them.
+        """
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection, _ in targets),
+            return_exceptions=True
+        )
+        disconnected = []
+        for target, result in zip(targets, results):
+            if isinstance(result, (WebSocketDisconnect, RuntimeError, ConnectionError)):
+                logger.warning(f"WebSocket connection error for session {target[1]}: {result}")
+                disconnected.append(target)
+            elif isinstance(result, BaseException):
+                raise result
+        return disconnected
 
     async def broadcast(self, message: dict, session_code: str):
         if session_code in self.active_connections:
-            disconnected = []
-            for connection in self.active_connections[session_code]:
-                try:
-                    await connection.send_json(message)
-                except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
-                    logger.warning(f"WebSocket connection error for session {session_code}: {e}")
-                    disconnected.append(connection)
+            payload = encode_ws_message(message)
+            # Snapshot the set; connects/disconnects may happen while sending
+            targets = [(connection, session_code) for connection in self.active_connections[session_code]]
+            disconnected = await self._send_to(targets, payload)
 
             # Clean up disconnected clients
-            for conn in disconnected:
+            for conn, _ in disconnected:
                 self.disconnect(conn, session_code)
 
     async def broadcast_to_all(self, message: dict):
         """Broadcast message to all active connections across all sessions."""
         logger.info(f"[BROADCAST_TO_ALL] Starting broadcast. Active sessions: {list(self.active_connections.keys())}")
-        disconnected = []
-        sent_count = 0
+        payload = encode_ws_message(message)
+        targets = []
         for session_code, connections in self.active_connections.items():
             logger.info(f"[BROADCAST_TO_ALL] Session '{session_code}' has {len(connections)} connections")
-            for connection in connections:
-                try:
-                    await connection.send_json(message)
-                    sent_count += 1
-                except (WebSocketDisconnect, RuntimeError, ConnectionError) as e:
-                    logger.warning(f"WebSocket connection error for session {session_code}: {e}")
-                    disconnected.append((connection, session_code))
+            targets.extend((connection, session_code) for connection in connections)
+        disconnected = await self._send_to(targets, payload)
+        sent_count = len(targets) - len(disconnected)
 
         # Clean up disconnected clients
         for conn, session_code in disconnected:
@@ -474,7 +496,7 @@ def restart_session(
     
     try:
         # API key and CSRF token are already verified by the dependencies
-        session = db.query(Session).filter(Session.instructor_code == instructor_code).first()
+        session = db.execute(MEETING_BY_INSTRUCTOR_CODE, {"code": instructor_code}).scalar_one_or_none()
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
 
@@ -493,7 +515,7 @@ def restart_session(
 # Question endpoints
 async def create_question(session_code: str, question: QuestionCreate, db: DBSession = Depends(get_db)):
     """Submit a new question to a session."""
-    session = db.query(Session).filter(Session.meeting_code == session_code, Session.is_active == True).first()
+    session = db.execute(ACTIVE_MEETING_BY_CODE, {"code": session_code}).scalar_one_or_none()
     if not session:
         raise HTTPException(status_code=404, detail="Session not found or inactive")
 
@@ -563,7 +585,7 @@ async def upvote_question(question_id: int, db: DBSession = Depends(get_db)):
 @limiter.limit("30/minute")
 async def get_session_stats(request: Request, session_code: str, db: DBSession = Depends(get_db)):
     """Get public stats for a session - question count, answered count, votes per question (no text)."""
-    session = db.query(Session).filter(Session.meeting_code == session_code).first()
+    session = db.execute(MEETING_BY_CODE, {"code": session_code}).scalar_one_or_none()
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -626,7 +648,7 @@ async def websocket_endpoint(websocket: WebSocket, session_code: str, db: DBSess
     try:
         # Validate that the session exists and is active BEFORE accepting connection
         logger.info(f"WebSocket validation: checking session code {session_code}")
-        session = db.query(Session).filter(Session.meeting_code == session_code).first()
+        session = db.execute(MEETING_BY_CODE, {"code": session_code}).scalar_one_or_none()
         logger.info(f"WebSocket validation: query returned session={session}")
     except Exception as e:
         logger.error(f"WebSocket validation error: {e}", exc_info=True)
@@ -1076,6 +1098,13 @@ def get_admin_stats(request: Request, db: DBSession = Depends(get_db), username:
     }
 
 
+@app.get("/api/admin/logs", response_class=PlainTextResponse)
+@limiter.limit("10/minute")
+def get_admin_logs(request: Request, username: str = Depends(verify_token)):
+    """Get the most recent part of the application log (last 1 MB at most)."""
+    return read_recent_logs()
+
+
 @app.get("/api/admin/sessions")
 @limiter.limit("60/minute")
 def get_all_sessions(
@@ -1089,24 +1118,23 @@ def get_all_sessions(
     """Get all sessions with pagination."""
     from sqlalchemy import func
 
-    query = db.query(Session)
+    # Count questions in the same query instead of loading every question row
+    query = db.query(Session, func.count(Question.id))\
+        .outerjoin(Question, Question.meeting_id == Session.id)
 
     if active_only:
         query = query.filter(Session.is_active == True)
 
-    # Use eager loading to avoid N+1 queries
-    sessions = query\
-        .options(selectinload(Session.questions))\
+    rows = query\
         .options(selectinload(Session.class_obj).selectinload(Class.instructor))\
+        .group_by(Session.id)\
         .order_by(Session.created_at.desc())\
         .offset(skip)\
         .limit(limit)\
         .all()
 
-    # Add question counts using loaded questions
     result = []
-    for session in sessions:
-        question_count = len(session.questions)
+    for session, question_count in rows:
         # Get instructor name from the class
         instructor_name = "Unknown"
         if session.class_obj and session.class_obj.instructor:
@@ -1130,7 +1158,7 @@ def get_all_sessions(
 @limiter.limit("20/minute")
 def delete_session_admin(request: Request, session_id: int, db: DBSession = Depends(get_db), username: str = Depends(verify_token)):
     """Delete a session (admin only)."""
-    session = db.query(Session).filter(Session.id == session_id).first()
+    session = db.get(Session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -12,7 +12,7 @@ class SystemConfig(Base):
     """System configuration settings."""
     __tablename__ = "system_config"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     key = Column(String(100), unique=True, nullable=False, index=True)
     value = Column(Text)
     value_type = Column(String(20), nullable=False, default="string")  # string, boolean, integer, json
@@ -43,25 +43,28 @@ class SystemConfig(Base):
         else:
             return str(self.value)
 
-    @classmethod
-    def set_value(cls, db, key: str, value, value_type: str = "string", description: str = None, updated_by: str = "admin"):
-        """Set or update a configuration value."""
-        config = db.query(cls).filter(cls.key == key).first()
-        
-        # Convert value to string for storage
+    @staticmethod
+    def serialize_value(value, value_type: str) -> str:
+        """Convert a value to its stored string form for the given type."""
         if value_type == "boolean":
             # Handle both actual booleans and string representations
             if isinstance(value, bool):
-                str_value = "true" if value else "false"
+                return "true" if value else "false"
             elif isinstance(value, str):
-                str_value = "true" if value.lower() in ('true', '1', 'yes') else "false"
+                return "true" if value.lower() in ('true', '1', 'yes') else "false"
             else:
-                str_value = "true" if value else "false"
+                return "true" if value else "false"
         elif value_type == "json":
             import json
-            str_value = json.dumps(value)
+            return json.dumps(value)
         else:
-            str_value = str(value)
+            return str(value)
+
+    @classmethod
+    def set_value(cls, db, key: str, value, value_type: str = "string", description: str = None, updated_by: str = "admin"):
+        """Set or update a configuration value."""
+        config = db.query(cls).filter(cls.key == key).first()
+        str_value = cls.serialize_value(value, value_type)
         
         if config:
             config.value = str_value
@@ -2,10 +2,11 @@
 Database models for RaiseMyHand v2.0
 Implements hierarchical architecture: Instructor → Class → ClassMeeting → Question → Answer
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, UniqueConstraint, Index, bindparam, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import base64
 import secrets
 
 Base = declarative_base()
@@ -61,10 +62,29 @@ class APIKey(Base):
     instructor = relationship("Instructor", back_populates="api_keys", foreign_keys=[instructor_id])
     class_meetings = relationship("ClassMeeting", back_populates="api_key")
 
+    # Random bytes behind each key (before base64url encoding)
+    KEY_BYTES = 32
+
     @staticmethod
     def generate_key():
         """Generate a secure API key."""
-        return f"rmh_{secrets.token_urlsafe(32)}"
+        return f"rmh_{secrets.token_urlsafe(APIKey.KEY_BYTES)}"
+
+    @staticmethod
+    def generate_keys(count, randbytes=secrets.token_bytes):
+        """
+        Generate count API keys in generate_key()'s format from one randbytes call.
+
+        randbytes defaults to the CSPRNG; pass a seeded source such as
+        random.Random.randbytes when reproducible keys are needed, as in the
+        demo fixtures.
+        """
+        size = APIKey.KEY_BYTES
+        raw = randbytes(size * count)
+        return [
+            "rmh_" + base64.urlsafe_b64encode(raw[i:i + size]).rstrip(b"=").decode()
+            for i in range(0, len(raw), size)
+        ]
 
 
 class Class(Base):
@@ -121,6 +141,13 @@ class ClassMeeting(Base):
         return secrets.token_urlsafe(length)[:length]
 
 
+# Meeting lookups used on every student/instructor request. Built once so the
+# endpoints only bind the code; run with db.execute(stmt, {"code": ...}).
+MEETING_BY_CODE = select(ClassMeeting).where(ClassMeeting.meeting_code == bindparam("code"))
+ACTIVE_MEETING_BY_CODE = MEETING_BY_CODE.where(ClassMeeting.is_active == True)
+MEETING_BY_INSTRUCTOR_CODE = select(ClassMeeting).where(ClassMeeting.instructor_code == bindparam("code"))
+
+
 class Question(Base):
     """A question submitted by a student, with moderation support."""
     __tablename__ = "questions"
@@ -64,7 +64,7 @@ def verify_question_ownership(question_id: int, key_record: APIKeyV2, db: DBSess
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Get the meeting
-    meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+    meeting = db.get(ClassMeeting, question.meeting_id)
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -112,7 +112,7 @@ def create_or_update_answer(
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Verify the meeting belongs to this instructor
-    meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+    meeting = db.get(ClassMeeting, question.meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -185,7 +185,7 @@ def get_answer(
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Verify the meeting belongs to this instructor
-    meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+    meeting = db.get(ClassMeeting, question.meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -219,7 +219,7 @@ def update_answer(
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Verify the meeting belongs to this instructor
-    meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+    meeting = db.get(ClassMeeting, question.meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -268,7 +268,7 @@ def delete_answer(
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Verify the meeting belongs to this instructor
-    meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+    meeting = db.get(ClassMeeting, question.meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
@@ -318,7 +318,7 @@ def publish_answer(
         raise HTTPException(status_code=404, detail="Question not found")
 
     # Verify the meeting belongs to this instructor
-    meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+    meeting = db.get(ClassMeeting, question.meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
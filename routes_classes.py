@@ -2,17 +2,21 @@
 Class and ClassMeeting management routes for v2 API
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Header
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session as DBSession, selectinload
 from sqlalchemy import func
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 from io import BytesIO, StringIO
 import csv
 import qrcode
 
 from database import get_db
-from models_v2 import Class, ClassMeeting, APIKey as APIKeyV2, Instructor, Question
+from models_v2 import (
+    Class, ClassMeeting, APIKey as APIKeyV2, Instructor, Question,
+    MEETING_BY_CODE, MEETING_BY_INSTRUCTOR_CODE
+)
 from schemas_v2 import (
     ClassCreate, ClassUpdate, ClassResponse, ClassWithMeetings,
     ClassMeetingCreate, ClassMeetingResponse, ClassMeetingWithQuestions,
@@ -442,9 +446,7 @@ def get_flagged_questions(
 ):
     """Get flagged questions for an instructor (for review and moderation)."""
     # Find meeting by instructor_code only (not meeting_code)
-    meeting = db.query(ClassMeeting).filter(
-        ClassMeeting.instructor_code == instructor_code
-    ).first()
+    meeting = db.execute(MEETING_BY_INSTRUCTOR_CODE, {"code": instructor_code}).scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -490,9 +492,7 @@ def end_meeting(
     Also supports JWT token and API key auth for backwards compatibility.
     """
     # First, verify the meeting exists and get it by instructor_code
-    meeting = db.query(ClassMeeting).filter(
-        ClassMeeting.instructor_code == instructor_code
-    ).first()
+    meeting = db.execute(MEETING_BY_INSTRUCTOR_CODE, {"code": instructor_code}).scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -573,9 +573,7 @@ def restart_meeting(
         )
     
     # First, verify the meeting exists and get it by instructor_code
-    meeting = db.query(ClassMeeting).filter(
-        ClassMeeting.instructor_code == instructor_code
-    ).first()
+    meeting = db.execute(MEETING_BY_INSTRUCTOR_CODE, {"code": instructor_code}).scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -704,11 +702,9 @@ def list_all_meetings(
     return responses
 
 
-@router.get("/api/meetings/{meeting_code}/qr")
-def get_meeting_qr_code(meeting_code: str, url_base: str):
-    """Generate QR code for meeting URL (v2 API)."""
-    url = f"{url_base}/student?code={meeting_code}"
-
+@lru_cache(maxsize=1024)
+def _render_qr_png(url: str) -> bytes:
+    """Render a QR code for the URL as PNG bytes (memoized per URL)."""
     qr = qrcode.QRCode(version=1, box_size=10, border=5)
     qr.add_data(url)
     qr.make(fit=True)
@@ -717,9 +713,20 @@ def get_meeting_qr_code(meeting_code: str, url_base: str):
 
     buf = BytesIO()
     img.save(buf, format='PNG')
-    buf.seek(0)
+    return buf.getvalue()
+
+
+@router.get("/api/meetings/{meeting_code}/qr")
+def get_meeting_qr_code(meeting_code: str, url_base: str):
+    """Generate QR code for meeting URL (v2 API)."""
+    url = f"{url_base}/student?code={meeting_code}"
 
-    return StreamingResponse(buf, media_type="image/png")
+    # The image depends only on the URL, so browsers may reuse it too
+    return Response(
+        content=_render_qr_png(url),
+        media_type="image/png",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
 
 
 @router.post("/api/meetings/{meeting_code}/verify-password")
@@ -729,9 +736,7 @@ def verify_meeting_password(
     db: DBSession = Depends(get_db)
 ):
     """Verify meeting password (v2 API)."""
-    meeting = db.query(ClassMeeting).filter(
-        ClassMeeting.meeting_code == meeting_code
-    ).first()
+    meeting = db.execute(MEETING_BY_CODE, {"code": meeting_code}).scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -745,6 +750,26 @@ def verify_meeting_password(
         raise HTTPException(status_code=401, detail="Incorrect password")
 
 
+REPORT_CSV_BATCH_ROWS = 500
+
+
+def _iter_report_csv(questions):
+    """Yield the meeting report CSV in small chunks instead of one big string."""
+    buf = StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["Question", "Upvotes", "Answered in Class", "Created At"])
+    for start in range(0, len(questions), REPORT_CSV_BATCH_ROWS):
+        writer.writerows(
+            (q.text, q.upvotes, "Yes" if q.is_answered_in_class else "No", q.created_at.isoformat())
+            for q in questions[start:start + REPORT_CSV_BATCH_ROWS]
+        )
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
 @router.get("/api/meetings/{instructor_code}/report")
 def get_meeting_report(
     instructor_code: str,
@@ -772,31 +797,21 @@ def get_meeting_report(
         instructor_id = key_record.instructor_id
     # Note: report can also be generated without auth for public access (optional)
 
-    meeting = db.query(ClassMeeting).filter(
-        ClassMeeting.instructor_code == instructor_code
-    ).first()
+    meeting = db.execute(MEETING_BY_INSTRUCTOR_CODE, {"code": instructor_code}).scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    questions = db.query(Question).filter(
+    # Only the reported columns, not full Question objects
+    questions = db.query(
+        Question.text, Question.upvotes, Question.is_answered_in_class, Question.created_at
+    ).filter(
         Question.meeting_id == meeting.id
     ).order_by(Question.upvotes.desc()).all()
 
     if format == "csv":
-        output = StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["Question", "Upvotes", "Answered in Class", "Created At"])
-        for q in questions:
-            writer.writerow([
-                q.text,
-                q.upvotes,
-                "Yes" if q.is_answered_in_class else "No",
-                q.created_at.isoformat()
-            ])
-
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _iter_report_csv(questions),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename=meeting_{meeting.meeting_code}_report.csv"}
         )
@@ -11,7 +11,7 @@ from better_profanity import profanity
 import asyncio
 
 from database import get_db
-from models_v2 import Question, ClassMeeting, QuestionVote
+from models_v2 import Question, ClassMeeting, QuestionVote, ACTIVE_MEETING_BY_CODE
 from schemas_v2 import QuestionCreate, QuestionResponse, QuestionUpdate
 from logging_config import get_logger, log_database_operation
 
@@ -59,10 +59,7 @@ async def create_question(
             detail="System is currently in maintenance mode. Questions cannot be submitted at this time."
         )
     
-    meeting = db.query(ClassMeeting).filter(
-        ClassMeeting.meeting_code == meeting_code,
-        ClassMeeting.is_active == True
-    ).first()
+    meeting = db.execute(ACTIVE_MEETING_BY_CODE, {"code": meeting_code}).scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found or inactive")
@@ -216,7 +213,7 @@ def edit_question(
         # Broadcast update to all connected clients
         try:
             from main import manager
-            meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+            meeting = db.get(ClassMeeting, question.meeting_id)
             if meeting:
                 broadcast_message = {
                     "type": "question_updated",
@@ -281,7 +278,7 @@ def toggle_vote(
         # Broadcast vote update to all connected clients for this meeting
         try:
             from main import manager
-            meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+            meeting = db.get(ClassMeeting, question.meeting_id)
             if meeting:
                 broadcast_message = {
                     "type": "upvote",
@@ -347,7 +344,7 @@ def mark_answered_in_class(
         # Broadcast answer status update to all connected clients for this meeting
         try:
             from main import manager
-            meeting = db.query(ClassMeeting).filter(ClassMeeting.id == question.meeting_id).first()
+            meeting = db.get(ClassMeeting, question.meeting_id)
             if meeting:
                 broadcast_message = {
                     "type": "answer_status",